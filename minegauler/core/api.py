@@ -9,7 +9,7 @@ TODO
 
 import abc
 import logging
-from typing import Callable, Dict, Iterable, List
+from typing import Callable, Dict, Iterable, List, Tuple
 
 from ..core import board
 from ..types import CellContentsType, GameState
@@ -17,6 +17,9 @@ from ..typing import Coord_T
 from . import utils
 
 
+logger = logging.getLogger(__name__)
+
+
 class AbstractListener(metaclass=abc.ABCMeta):
     """
     An abstract class outlining methods that should be implemented to receive
@@ -24,12 +27,13 @@ class AbstractListener(metaclass=abc.ABCMeta):
     then be registered to listen for callbacks.
     """
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def reset(self) -> None:
         """
         Called to indicate the state should be reset.
         """
-        return NotImplemented
 
     @abc.abstractmethod
     def resize(self, x_size: int, y_size: int, mines: int) -> None:
@@ -43,7 +47,6 @@ class AbstractListener(metaclass=abc.ABCMeta):
         :param mines:
             The number of mines.
         """
-        return NotImplemented
 
     @abc.abstractmethod
     def update_cells(self, cell_updates: Dict[Coord_T, CellContentsType]) -> None:
@@ -53,7 +56,6 @@ class AbstractListener(metaclass=abc.ABCMeta):
         :param cell_updates:
             Mapping of coordinates that were changed to the new cell state.
         """
-        return NotImplemented
 
     @abc.abstractmethod
     def update_game_state(self, game_state: GameState) -> None:
@@ -63,7 +65,6 @@ class AbstractListener(metaclass=abc.ABCMeta):
         :param game_state:
             The new game state.
         """
-        return NotImplemented
 
     @abc.abstractmethod
     def update_mines_remaining(self, mines_remaining: int) -> None:
@@ -73,7 +74,6 @@ class AbstractListener(metaclass=abc.ABCMeta):
         :param mines_remaining:
             The new number of mines remaining.
         """
-        return NotImplemented
 
     @abc.abstractmethod
     def set_finish_time(self, finish_time: float) -> None:
@@ -83,7 +83,6 @@ class AbstractListener(metaclass=abc.ABCMeta):
         :param finish_time:
             The elapsed game time in seconds.
         """
-        return NotImplemented
 
     @abc.abstractmethod
     def handle_exception(self, method: str, exc: Exception) -> None:
@@ -97,7 +96,21 @@ class AbstractListener(metaclass=abc.ABCMeta):
         :param exc:
             The caught exception.
         """
-        return NotImplemented
+
+
+# The methods defined on AbstractListener for receiving updates, in a fixed
+#  order. This is all of the abstract methods except handle_exception().
+_NOTIFY_METHODS = (
+    "reset",
+    "resize",
+    "update_cells",
+    "update_game_state",
+    "update_mines_remaining",
+    "set_finish_time",
+)
+
+# A listener with one of its methods and its handle_exception().
+_Callback_T = Tuple["AbstractListener", Callable, Callable]
 
 
 class Caller(AbstractListener):
@@ -105,7 +118,11 @@ class Caller(AbstractListener):
     Pass on calls to registered listeners.
     """
 
-    _count: int = 0
+    __slots__ = (
+        "_listeners",
+        "_iterating",
+        *(f"_cb_{method}" for method in _NOTIFY_METHODS),
+    )
 
     def __init__(self, listeners: Iterable[AbstractListener] = None):
         """
@@ -113,24 +130,52 @@ class Caller(AbstractListener):
 
         :param listeners:
         """
-        self._listeners: List[AbstractListener] = list(listeners) if listeners else []
-        self._id: int = self._count
-        self._logger = logging.getLogger(f"{__name__}.{type(self).__name__}{self._id}")
-
-        self.__class__._count += 1
+        # Mapping of registered listeners to their callbacks, in the order
+        #  given by _NOTIFY_METHODS. Insertion order gives the call order.
+        self._listeners: Dict[AbstractListener, Tuple[_Callback_T, ...]] = {}
+        # The callbacks of registered listeners for each listener method,
+        #  kept up to date on register/unregister to avoid lookups per call.
+        self._cb_reset: List[_Callback_T] = []
+        self._cb_resize: List[_Callback_T] = []
+        self._cb_update_cells: List[_Callback_T] = []
+        self._cb_update_game_state: List[_Callback_T] = []
+        self._cb_update_mines_remaining: List[_Callback_T] = []
+        self._cb_set_finish_time: List[_Callback_T] = []
+        # Depth of notifications currently being dispatched, used to avoid
+        #  mutating a callback list that is being iterated over.
+        self._iterating: int = 0
+
+        for listener in listeners or ():
+            self.register_listener(listener)
 
-        # Do the method wrapping here because we need the registered listeners.
-        for method in AbstractListener.__abstractmethods__:
-            setattr(self, method, self._call_registered(method))
+    @property
+    def has_listeners(self) -> bool:
+        """Whether any listeners are registered."""
+        return bool(self._listeners)
 
     def register_listener(self, listener: AbstractListener) -> None:
         """
         Register a listener to receive updates from the controller.
 
+        Listeners are called in the order they were registered. Registering a
+        listener that is already registered does nothing, so a listener is
+        only ever called once per update. Listeners are tracked by hash, so
+        must be hashable.
+
         :param listener:
             An AbstractListener instance to register.
         """
-        self._listeners.append(listener)
+        if listener in self._listeners:
+            logger.debug("Listener already registered - nothing to do")
+            return
+        handle_exception = listener.handle_exception
+        callbacks = tuple(
+            (listener, getattr(listener, method), handle_exception)
+            for method in _NOTIFY_METHODS
+        )
+        self._listeners[listener] = callbacks
+        for method, cb in zip(_NOTIFY_METHODS, callbacks):
+            self._get_mutable_callbacks(method).append(cb)
 
     def unregister_listener(self, listener: AbstractListener) -> None:
         """
@@ -141,41 +186,64 @@ class Caller(AbstractListener):
         :param listener:
             An AbstractListener instance to unregister.
         """
-        try:
-            self._listeners.remove(listener)
-        except ValueError:
-            self._logger.debug("Listener not registered - nothing to do")
+        if self._listeners.pop(listener, None) is None:
+            logger.debug("Listener not registered - nothing to do")
+            return
+        # Rebuild the callback lists rather than searching each one. New lists
+        #  are created, so this is safe during a notification.
+        for i, method in enumerate(_NOTIFY_METHODS):
+            setattr(self, f"_cb_{method}", [cbs[i] for cbs in self._listeners.values()])
 
-    def _call_registered(self, func) -> Callable:
+    def _get_mutable_callbacks(self, method: str) -> List[_Callback_T]:
         """
-        Decorator to call all registered listeners.
+        Get the list of callbacks for a method, safe to be modified in place.
 
-        :param func:
-            The name of the method to decorate.
+        If a notification is currently being dispatched the list is replaced
+        with a copy, leaving the list being iterated over untouched. This
+        avoids having to copy the list on every notification.
+
+        :param method:
+            The name of the method to get the callbacks for.
         :return:
-            The decorated version of the method.
+            The list of callbacks.
         """
-        if not hasattr(self, func + "_orig"):
-            setattr(self, func + "_orig", getattr(self, func))
+        attr_name = f"_cb_{method}"
+        callbacks = getattr(self, attr_name)
+        if self._iterating:
+            callbacks = callbacks.copy()
+            setattr(self, attr_name, callbacks)
+        return callbacks
 
-        def wrapped(*args, **kwargs):
-            getattr(self, func + "_orig")(*args, **kwargs)
-            for listener in self._listeners:
+    def _call_registered(
+        self, method: str, callbacks: List[_Callback_T], *args
+    ) -> None:
+        """
+        Call a method on all registered listeners.
+
+        :param method:
+            The name of the method to call.
+        :param callbacks:
+            The callbacks of the registered listeners for the method.
+        :param args:
+            The arguments to pass to the method.
+        """
+        self._iterating += 1
+        try:
+            for listener, cb, handle_exception in callbacks:
                 try:
-                    getattr(listener, func)(*args, **kwargs)
+                    cb(*args)
                 except Exception as e:
-                    self._logger.warning(
-                        f"Error ocurred calling {func}() on {listener}"
-                    )
-                    listener.handle_exception(func, e)
-
-        return wrapped
+                    logger.warning("Error ocurred calling %s() on %s", method, listener)
+                    handle_exception(method, e)
+        finally:
+            self._iterating -= 1
 
     def reset(self) -> None:
         """
         Called to indicate the state should be reset.
         """
-        self._logger.debug("Calling reset()")
+        logger.debug("Calling reset()")
+        self._call_registered("reset", self._cb_reset)
 
     def resize(self, x_size: int, y_size: int, mines: int) -> None:
         """
@@ -188,7 +256,8 @@ class Caller(AbstractListener):
         :param mines:
             The number of mines.
         """
-        self._logger.debug(f"Calling resize() with {x_size}, {y_size}, {mines}")
+        logger.debug("Calling resize() with %s, %s, %s", x_size, y_size, mines)
+        self._call_registered("resize", self._cb_resize, x_size, y_size, mines)
 
     def update_cells(self, cell_updates: Dict[Coord_T, CellContentsType]) -> None:
         """
@@ -197,9 +266,8 @@ class Caller(AbstractListener):
         :param cell_updates:
             Mapping of coordinates that were changed to the new cell state.
         """
-        self._logger.debug(
-            f"Calling update_cells() with {len(cell_updates)} updated cells"
-        )
+        logger.debug("Calling update_cells() with %d updated cells", len(cell_updates))
+        self._call_registered("update_cells", self._cb_update_cells, cell_updates)
 
     def update_game_state(self, game_state: GameState) -> None:
         """
@@ -208,7 +276,10 @@ class Caller(AbstractListener):
         :param game_state:
             The new game state.
         """
-        self._logger.debug(f"Calling update_game_state() with {game_state}")
+        logger.debug("Calling update_game_state() with %s", game_state)
+        self._call_registered(
+            "update_game_state", self._cb_update_game_state, game_state
+        )
 
     def update_mines_remaining(self, mines_remaining: int) -> None:
         """
@@ -217,7 +288,10 @@ class Caller(AbstractListener):
         :param mines_remaining:
             The new number of mines remaining.
         """
-        self._logger.debug(f"Calling update_mines_remaining() with {mines_remaining}")
+        logger.debug("Calling update_mines_remaining() with %s", mines_remaining)
+        self._call_registered(
+            "update_mines_remaining", self._cb_update_mines_remaining, mines_remaining
+        )
 
     def set_finish_time(self, finish_time: float) -> None:
         """
@@ -226,13 +300,13 @@ class Caller(AbstractListener):
         :param finish_time:
             The elapsed game time in seconds.
         """
-        self._logger.debug(f"Calling set_finish_time() with {finish_time}")
+        logger.debug("Calling set_finish_time() with %s", finish_time)
+        self._call_registered("set_finish_time", self._cb_set_finish_time, finish_time)
 
     def handle_exception(self, method: str, exc: Exception) -> None:
         """
         Not used in this class - provided only to satisfy the ABC.
         """
-        return NotImplemented
 
 
 class AbstractController(metaclass=abc.ABCMeta):
@@ -241,6 +315,8 @@ class AbstractController(metaclass=abc.ABCMeta):
     updates.
     """
 
+    __slots__ = ("opts", "_notif", "_logger", "__weakref__")
+
     def __init__(self, opts: utils.GameOptsStruct):
         self.opts = utils.GameOptsStruct._from_struct(opts)
         # The registered functions to be called with updates.
@@ -282,7 +358,9 @@ class AbstractController(metaclass=abc.ABCMeta):
     @property
     @abc.abstractmethod
     def board(self) -> board.Board:
-        return NotImplemented
+        """
+        The current board state.
+        """
 
     # --------------------------------------------------------------------------
     # Methods triggered by user interaction
@@ -292,62 +370,51 @@ class AbstractController(metaclass=abc.ABCMeta):
         """
         Create a new game, refresh the board state.
         """
-        self._logger.info("New game requested, refreshing the board")
 
     @abc.abstractmethod
     def restart_game(self) -> None:
         """
         Restart the current game, refresh the board state.
         """
-        self._logger.info("Restart game requested, refreshing the board")
 
     @abc.abstractmethod
     def select_cell(self, coord: Coord_T) -> None:
         """
         Select a cell for a regular click.
         """
-        self._logger.info("Cell %s selected", coord)
 
     @abc.abstractmethod
     def flag_cell(self, coord: Coord_T, *, flag_only: bool = False) -> None:
         """
         Select a cell for flagging.
         """
-        self._logger.info("Cell %s selected for flagging", coord)
 
     @abc.abstractmethod
     def chord_on_cell(self, coord: Coord_T) -> None:
         """
         Select a cell for chording.
         """
-        self._logger.info("Cell %s selected for chording", coord)
 
     @abc.abstractmethod
     def remove_cell_flags(self, coord: Coord_T) -> None:
         """
         Remove flags in a cell, if any.
         """
-        self._logger.info("Flags in cell %s being removed", coord)
 
     @abc.abstractmethod
     def resize_board(self, x_size: int, y_size: int, mines: int) -> None:
         """
         Resize the board and/or change the number of mines.
         """
-        self._logger.info(
-            "Resizing the board to %sx%s with %s mines", x_size, y_size, mines
-        )
 
     @abc.abstractmethod
     def set_first_success(self, value: bool) -> None:
         """
         Set whether the first click should be a guaranteed success.
         """
-        self._logger.info("Setting first success to %s", value)
 
     @abc.abstractmethod
     def set_per_cell(self, value: int) -> None:
         """
         Set the maximum number of mines per cell.
         """
-        self._logger.info("Setting per cell to %s", value)
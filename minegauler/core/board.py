@@ -19,6 +19,8 @@ class Board(Grid):
     CellContentsType.
     """
 
+    __slots__ = ()
+
     def __init__(self, x_size: int, y_size: int):
         """
         Arguments:
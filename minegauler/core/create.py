@@ -31,17 +31,17 @@ class CreateController(api.AbstractController):
 
     def new_game(self) -> None:
         """See AbstractController."""
-        super().new_game()
+        self._logger.info("New game requested, refreshing the board")
         self._board = board.Board(self.opts.x_size, self.opts.y_size)
         self._flags = 0
         self._notif.reset()
 
     def restart_game(self) -> None:
-        super().restart_game()
+        self._logger.info("Restart game requested, refreshing the board")
         self.new_game()
 
     def select_cell(self, coord: Coord_T) -> None:
-        super().select_cell(coord)
+        self._logger.info("Cell %s selected", coord)
         cell = self._board[coord]
         if cell is CellUnclicked():
             self._board[coord] = CellNum(0)
@@ -52,7 +52,7 @@ class CreateController(api.AbstractController):
         self._notif.update_cells({coord: self._board[coord]})
 
     def flag_cell(self, coord: Coord_T, *, flag_only: bool = False) -> None:
-        super().flag_cell(coord)
+        self._logger.info("Cell %s selected for flagging", coord)
         cell = self._board[coord]
 
         if cell is CellUnclicked():
@@ -75,10 +75,10 @@ class CreateController(api.AbstractController):
         self._notif.update_mines_remaining(self._flags)
 
     def chord_on_cell(self, coord: Coord_T) -> None:
-        super().chord_on_cell(coord)
+        self._logger.info("Cell %s selected for chording", coord)
 
     def remove_cell_flags(self, coord: Coord_T) -> None:
-        super().remove_cell_flags(coord)
+        self._logger.info("Flags in cell %s being removed", coord)
         cell = self._board[coord]
         if not isinstance(cell, CellMine):
             return
@@ -88,7 +88,9 @@ class CreateController(api.AbstractController):
         self._notif.update_mines_remaining(self._flags)
 
     def resize_board(self, x_size: int, y_size: int, mines: int) -> None:
-        super().resize_board(x_size, y_size, mines)
+        self._logger.info(
+            "Resizing the board to %sx%s with %s mines", x_size, y_size, mines
+        )
         if (
             x_size == self.opts.x_size
             and y_size == self.opts.y_size
@@ -116,10 +118,10 @@ class CreateController(api.AbstractController):
         self.new_game()
 
     def set_first_success(self, value: bool) -> None:
-        super().set_first_success(value)
+        self._logger.info("Setting first success to %s", value)
         # Store the value so it can be retrieved from the next controller.
         self.opts.first_success = value
 
     def set_per_cell(self, value: int) -> None:
-        super().set_per_cell(value)
+        self._logger.info("Setting per cell to %s", value)
         self.opts.per_cell = value
@@ -10,7 +10,8 @@ Controller (class)
 """
 
 import logging
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 import attr
 
@@ -21,8 +22,11 @@ from . import api, board, game, utils
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only default for when there are no cell updates.
+_EMPTY_CELLS: Mapping[Coord_T, CellContentsType] = MappingProxyType({})
 
-@attr.attrs(auto_attribs=True)
+
+@attr.attrs(auto_attribs=True, slots=True, eq=False)
 class SharedInfo:
     """
     Information to pass to frontends.
@@ -43,7 +47,7 @@ class SharedInfo:
         The time elapsed if the game has ended, otherwise None.
     """
 
-    cell_updates: Dict[Coord_T, CellContentsType] = attr.Factory(dict)
+    cell_updates: Optional[Mapping[Coord_T, CellContentsType]] = _EMPTY_CELLS
     game_state: GameState = GameState.READY
     mines_remaining: int = 0
     lives_remaining: int = 0
@@ -60,6 +64,8 @@ class Controller(api.AbstractController):
         Options for use in games.
     """
 
+    __slots__ = ("_game", "_last_update")
+
     def __init__(self, opts: utils.GameOptsStruct):
         """
         Arguments:
@@ -82,14 +88,15 @@ class Controller(api.AbstractController):
     # --------------------------------------------------------------------------
     def new_game(self) -> None:
         """See AbstractController."""
-        super().new_game()
+        self._logger.info("New game requested, refreshing the board")
+        opts = self.opts
         self._game = game.Game(
-            x_size=self.opts.x_size,
-            y_size=self.opts.y_size,
-            mines=self.opts.mines,
-            per_cell=self.opts.per_cell,
-            lives=self.opts.lives,
-            first_success=self.opts.first_success,
+            x_size=opts.x_size,
+            y_size=opts.y_size,
+            mines=opts.mines,
+            per_cell=opts.per_cell,
+            lives=opts.lives,
+            first_success=opts.first_success,
         )
         self._send_reset_update()
 
@@ -97,53 +104,56 @@ class Controller(api.AbstractController):
         """See AbstractController."""
         if not self._game.mf:
             return
-        super().restart_game()
+        self._logger.info("Restart game requested, refreshing the board")
         self._game = game.Game(minefield=self._game.mf, lives=self.opts.lives)
         self._send_reset_update()
 
     def select_cell(self, coord: Coord_T) -> None:
         """See AbstractController."""
-        super().select_cell(coord)
+        self._logger.info("Cell %s selected", coord)
         cells = self._game.select_cell(coord)
         self._send_updates(cells)
 
     def flag_cell(self, coord: Coord_T, *, flag_only: bool = False) -> None:
         """See AbstractController."""
-        super().flag_cell(coord)
+        self._logger.info("Cell %s selected for flagging", coord)
 
-        cell_state = self._game.board[coord]
+        game_ = self._game
+        cell_state = game_.board[coord]
+        cells = None
         if cell_state is CellUnclicked():
-            self._game.set_cell_flags(coord, 1)
+            cells = game_.set_cell_flags(coord, 1)
         elif isinstance(cell_state, CellFlag):
             if cell_state.num == self.opts.per_cell:
                 if flag_only:
                     return
-                self._game.set_cell_flags(coord, 0)
+                cells = game_.set_cell_flags(coord, 0)
             else:
-                self._game.set_cell_flags(coord, cell_state.num + 1)
+                cells = game_.set_cell_flags(coord, cell_state.num + 1)
 
-        self._send_updates({coord: self._game.board[coord]})
+        self._send_updates(cells)
 
     def remove_cell_flags(self, coord: Coord_T) -> None:
         """See AbstractController."""
-        super().remove_cell_flags(coord)
-        self._game.set_cell_flags(coord, 0)
-        self._send_updates({coord: self._game.board[coord]})
+        self._logger.info("Flags in cell %s being removed", coord)
+        if not isinstance(self._game.board[coord], CellFlag):
+            return
+        cells = self._game.set_cell_flags(coord, 0)
+        self._send_updates(cells)
 
     def chord_on_cell(self, coord: Coord_T) -> None:
         """See AbstractController."""
-        super().chord_on_cell(coord)
+        self._logger.info("Cell %s selected for chording", coord)
         cells = self._game.chord_on_cell(coord)
         self._send_updates(cells)
 
     def resize_board(self, *, x_size: int, y_size: int, mines: int) -> None:
         """See AbstractController."""
-        super().resize_board(x_size, y_size, mines)
-        if (
-            x_size == self.opts.x_size
-            and y_size == self.opts.y_size
-            and mines == self.opts.mines
-        ):
+        self._logger.info(
+            "Resizing the board to %sx%s with %s mines", x_size, y_size, mines
+        )
+        opts = self.opts
+        if x_size == opts.x_size and y_size == opts.y_size and mines == opts.mines:
             logger.info(
                 "No resize required as the parameters are unchanged, starting a new game"
             )
@@ -152,16 +162,16 @@ class Controller(api.AbstractController):
 
         logger.info(
             "Resizing board from %sx%s with %s mines to %sx%s with %s mines",
-            self.opts.x_size,
-            self.opts.y_size,
-            self.opts.mines,
+            opts.x_size,
+            opts.y_size,
+            opts.mines,
             x_size,
             y_size,
             mines,
         )
-        self.opts.x_size = x_size
-        self.opts.y_size = y_size
-        self.opts.mines = mines
+        opts.x_size = x_size
+        opts.y_size = y_size
+        opts.mines = mines
         self._send_resize_update()
         self.new_game()
 
@@ -169,14 +179,14 @@ class Controller(api.AbstractController):
         """
         Set whether the first click should be a guaranteed success.
         """
-        super().set_first_success(value)
+        self._logger.info("Setting first success to %s", value)
         self.opts.first_success = value
 
     def set_per_cell(self, value: int) -> None:
         """
         Set the maximum number of mines per cell.
         """
-        super().set_per_cell(value)
+        self._logger.info("Setting per cell to %s", value)
         if self.opts.per_cell != value:
             self.opts.per_cell = value
             if self._game.state.unstarted():
@@ -188,33 +198,54 @@ class Controller(api.AbstractController):
     def _send_reset_update(self) -> None:
         self._notif.reset()
         self._last_update = SharedInfo()
-        self._cells_updated = dict()
 
     def _send_resize_update(self) -> None:
         self._notif.resize(self.opts.x_size, self.opts.y_size, self.opts.mines)
 
-    def _send_updates(self, cells_updated: Dict[Coord_T, CellContentsType]) -> None:
-        """Send updates to registered listeners."""
-        update = SharedInfo(
-            cell_updates=cells_updated,
-            mines_remaining=self._game.mines_remaining,
-            lives_remaining=self._game.lives_remaining,
-            game_state=self._game.state,
-            finish_time=self._game.get_elapsed() if self._game.is_finished() else None,
+    def _send_updates(
+        self, cells_updated: Optional[Dict[Coord_T, CellContentsType]]
+    ) -> None:
+        """
+        Send updates to registered listeners.
+
+        :param cells_updated:
+            The cell updates returned by the game for the action performed,
+            passed straight through to listeners. May be None or empty if no
+            cells changed.
+        """
+        game_ = self._game
+        mines_remaining = game_.mines_remaining
+        game_state = game_.state
+        finish_time = game_.get_elapsed() if game_.is_finished() else None
+
+        # Work out what changed since the last update before notifying.
+        last_update = self._last_update
+        mines_changed = mines_remaining != last_update.mines_remaining
+        state_changed = game_state is not last_update.game_state
+        finish_time_changed = (
+            finish_time is not None and finish_time != last_update.finish_time
         )
+        if not (cells_updated or mines_changed or state_changed or finish_time_changed):
+            return
 
-        if update.cell_updates:
-            self._notif.update_cells(update.cell_updates)
-        if update.mines_remaining != self._last_update.mines_remaining:
-            self._notif.update_mines_remaining(update.mines_remaining)
-        # if update.lives_remaining != self._last_update.lives_remaining:
-        #     self._notif.update_lives_remaining(update.lives_remaining)
-        if update.game_state is not self._last_update.game_state:
-            self._notif.update_game_state(update.game_state)
-        if (
-            update.finish_time is not None
-            and update.finish_time != self._last_update.finish_time
-        ):
-            self._notif.set_finish_time(update.finish_time)
-
-        self._last_update = update
+        # Skip dispatching when nobody is listening, but still record the
+        #  update below so that any later listener receives correct changes.
+        if self._notif.has_listeners:
+            if cells_updated:
+                self._notif.update_cells(cells_updated)
+            if mines_changed:
+                self._notif.update_mines_remaining(mines_remaining)
+            # if lives_changed:
+            #     self._notif.update_lives_remaining(lives_remaining)
+            if state_changed:
+                self._notif.update_game_state(game_state)
+            if finish_time_changed:
+                self._notif.set_finish_time(finish_time)
+
+        self._last_update = SharedInfo(
+            cell_updates=cells_updated,
+            mines_remaining=mines_remaining,
+            lives_remaining=game_.lives_remaining,
+            game_state=game_state,
+            finish_time=finish_time,
+        )
@@ -471,7 +471,7 @@ class Game:
         """Chord on a cell that contains a revealed number."""
         nbrs = self.board.get_nbrs(coord)
         num_flagged_nbrs = sum(
-            [self.board[c].num for c in nbrs if isinstance(self.board[c], CellMineType)]
+            self.board[c].num for c in nbrs if isinstance(self.board[c], CellMineType)
         )
         logger.debug(
             "%s flagged mine(s) around clicked cell showing number %s",
@@ -8,7 +8,8 @@ Grid (class)
     Representation of a 2D grid using nested lists.
 """
 
-from typing import Iterable
+import functools
+from typing import Dict, Iterable, Tuple
 
 from minegauler.typing import Coord_T
 
@@ -26,6 +27,8 @@ class Grid(list):
         List of all coordinates in the grid.
     """
 
+    __slots__ = ("x_size", "y_size", "all_coords")
+
     def __init__(self, x_size, y_size, *, fill=0):
         """
         Arguments:
@@ -65,34 +68,38 @@ class Grid(list):
 
         # Use max length of object representation if no cell size given.
         if cell_size is None:
-            cell_size = max([len(repr(obj)) for row in self for obj in row])
+            cell_size = max(len(repr(obj)) for row in self for obj in row)
+
+        # Get the representations of the objects row by row, converting a dict
+        #  mapping's values to strings once up front.
+        if isinstance(mapping, dict):
+            str_mapping = {k: str(v) for k, v in mapping.items()}
+            rows = (
+                [str_mapping[obj] if obj in str_mapping else repr(obj) for obj in row]
+                for row in self
+            )
+        elif mapping is not None:
+            rows = ([str(mapping(obj)) for obj in row] for row in self)
+        else:
+            rows = ([repr(obj) for obj in row] for row in self)
 
-        cell = "{:>%d}" % cell_size
-        ret = ""
-        for row in self:
-            for obj in row:
-                if isinstance(mapping, dict):
-                    rep = str(mapping[obj]) if obj in mapping else repr(obj)
-                elif mapping is not None:
-                    rep = str(mapping(obj))
-                else:
-                    rep = repr(obj)
-                ret += cell.format(rep[:cell_size]) + " "
-            ret = ret[:-1]  # Remove trailing space
-            ret += "\n"
-        ret = ret[:-1]  # Remove trailing newline
-
-        return ret
+        fmt_cell = ("{:>%d}" % cell_size).format
+        return "\n".join(
+            " ".join([fmt_cell(rep[:cell_size]) for rep in row]) for row in rows
+        )
 
     def __getitem__(self, key):
         if type(key) is tuple and len(key) == 2:
-            return self[key[1]][key[0]]
+            x, y = key
+            # Get the row directly rather than going back through this method.
+            return list.__getitem__(self, y)[x]
         else:
             return super().__getitem__(key)
 
     def __setitem__(self, key, value):
         if type(key) is tuple and len(key) == 2:
-            self[key[1]][key[0]] = value
+            x, y = key
+            list.__getitem__(self, y)[x] = value
         else:
             super().__setitem__(key, value)
 
@@ -125,8 +132,7 @@ class Grid(list):
             The item to fill the grid with.
         """
         for row in self:
-            for i in range(len(row)):
-                row[i] = item
+            row[:] = [item] * len(row)
 
     def get_nbrs(self, coord: Coord_T, *, include_origin=False) -> Iterable[Coord_T]:
         """
@@ -141,17 +147,40 @@ class Grid(list):
         Return: [(int, int), ...]
             List of coordinates within the boundaries of the grid.
         """
-        x, y = coord
-        nbrs = []
-        for i in range(max(0, x - 1), min(self.x_size, x + 2)):
-            for j in range(max(0, y - 1), min(self.y_size, y + 2)):
-                nbrs.append((i, j))
-        if not include_origin:
-            nbrs.remove(coord)
-        return nbrs
+        nbrs = self._get_nbrs_table()[coord]
+        if include_origin:
+            return sorted((*nbrs, coord))
+        else:
+            return list(nbrs)
+
+    def _get_nbrs_table(self) -> Dict[Coord_T, Tuple[Coord_T, ...]]:
+        """
+        Get a mapping of each coordinate to the coordinates of its neighbours,
+        excluding the coordinate itself. The mapping is shared between all
+        grids of the same size, so must not be modified.
+        """
+        return _build_nbrs_table(self.x_size, self.y_size)
 
     def copy(self):
         ret = Grid(self.x_size, self.y_size)
         for coord in self.all_coords:
             ret[coord] = self[coord]
         return ret
+
+
+@functools.lru_cache(maxsize=16)
+def _build_nbrs_table(x_size: int, y_size: int) -> Dict[Coord_T, Tuple[Coord_T, ...]]:
+    """
+    Create the mapping of each coordinate to its neighbours in a grid of the
+    given size. The result is cached, so must not be modified.
+    """
+    return {
+        (x, y): tuple(
+            (i, j)
+            for i in range(max(0, x - 1), min(x_size, x + 2))
+            for j in range(max(0, y - 1), min(y_size, y + 2))
+            if (i, j) != (x, y)
+        )
+        for x in range(x_size)
+        for y in range(y_size)
+    }
@@ -12,7 +12,8 @@ __all__ = ("Minefield",)
 
 import logging
 import random as rnd
-from typing import Iterable, List, Optional, Union
+from collections import deque
+from typing import Iterable, List, Optional, Tuple, Union
 
 from minegauler.types import CellFlag, CellNum
 from minegauler.typing import Coord_T
@@ -87,8 +88,8 @@ class Minefield(Grid):
             self[c] += 1
         self.mine_coords = mine_coords
         self.completed_board = self._calc_completed_board()
-        self.openings = self._find_openings()
-        self.bbbv = self._calc_3bv()
+        self.openings, nr_exposed = self._find_openings()
+        self.bbbv = self._calc_3bv(nr_exposed)
 
     def __repr__(self):
         mines_str = f" with {self.nr_mines} mines" if self.nr_mines else ""
@@ -136,25 +137,28 @@ class Minefield(Grid):
         :raise ValueError:
             If the number of mines is too high to fit in the grid.
         """
+        safe_coords = frozenset(safe_coords or ())
         self.check_enough_space(
             x_size=self.x_size,
             y_size=self.y_size,
             mines=self.nr_mines,
             per_cell=self.per_cell,
-            nr_safe_cells=len(set(safe_coords)) if safe_coords else 1,
+            nr_safe_cells=len(safe_coords) or 1,
         )
 
         # Get a list of coordinates which can have mines placed in them.
-        if safe_coords is None:
-            avble_coords = self.all_coords.copy()
-        else:
+        if safe_coords:
             avble_coords = [c for c in self.all_coords if c not in safe_coords]
+        else:
+            avble_coords = self.all_coords.copy()
         # Make sure there is at least one safe cell.
         if len(avble_coords) == len(self.all_coords):
             avble_coords.pop(rnd.randint(0, len(avble_coords) - 1))
-        avble_coords *= self.per_cell
-        rnd.shuffle(avble_coords)
-        return avble_coords[: self.nr_mines]
+        # Sample mine positions from the available coords repeated per_cell
+        #  times, without building the repeated list.
+        nr_avble = len(avble_coords)
+        picks = rnd.sample(range(nr_avble * self.per_cell), self.nr_mines)
+        return [avble_coords[i % nr_avble] for i in picks]
 
     @staticmethod
     def check_enough_space(
@@ -199,49 +203,72 @@ class Minefield(Grid):
         Create the completed board with the flags and numbers that should be
         seen upon game completion.
         """
+        nbrs_table = self._get_nbrs_table()
+        # Count the mines around each cell, only visiting cells with mines.
+        #  The counts are indexed [y][x] in the same way as the grid's rows.
+        nbr_mines = [[0] * self.x_size for _ in range(self.y_size)]
+        for x, y in set(self.mine_coords):
+            mines = self[y][x]
+            for i, j in nbrs_table[(x, y)]:
+                nbr_mines[j][i] += mines
+
         completed_board = Board(self.x_size, self.y_size)
-        completed_board.fill(CellNum(0))
-        for c in self.all_coords:
-            mines = self[c]
-            if mines > 0:
-                completed_board[c] = CellFlag(mines)
-                for nbr in self.get_nbrs(c):
-                    # For neighbouring cells that don't contain mines, increment
-                    #  their number.
-                    if not self.cell_contains_mine(nbr):
-                        completed_board[nbr] += mines
+        for mf_row, count_row, board_row in zip(self, nbr_mines, completed_board):
+            for x, mines in enumerate(mf_row):
+                board_row[x] = CellFlag(mines) if mines else CellNum(count_row[x])
         return completed_board
 
-    def _find_openings(self) -> List[List[Coord_T]]:
+    def _find_openings(self) -> Tuple[List[List[Coord_T]], int]:
         """
-        Find the openings of the board. A list of openings is stored, each
+        Find the openings of the board. A list of openings is returned, each
         represented as a list of coordinates belonging to that opening.
-        Note that each cell cannot belong to multiple openings.
+        Note that each blank cell cannot belong to multiple openings, but the
+        numbered cells on the edge of an opening can.
+
+        :return:
+            A tuple of the openings and the number of distinct cells they
+            expose.
         """
+        y_size = self.y_size
+        all_coords = self.all_coords
+        nbrs_table = self._get_nbrs_table()
+        # Cells are referred to by their index in all_coords, given by
+        #  x * y_size + y, which sorts in the same order as the coordinates.
+        is_blank = [self.completed_board[c] is CellNum(0) for c in all_coords]
+        # The index of the opening each cell was last added to.
+        in_opening = [-1] * len(all_coords)
         openings = []
-        blanks_to_check = {
-            c for c in self.all_coords if self.completed_board[c] == CellNum(0)
-        }
-        while blanks_to_check:
-            orig_coord = blanks_to_check.pop()
-            # If the coordinate is part of an opening and hasn't already been
-            #  considered, start a new opening.
-            opening = {orig_coord}  # Coords belonging to the opening
-            check = {orig_coord}  # Coords whose neighbours need checking
+        nr_exposed = 0
+        for start, orig_coord in enumerate(all_coords):
+            # Start a new opening from each blank cell not already considered.
+            if not is_blank[start] or in_opening[start] >= 0:
+                continue
+            opening_idx = len(openings)
+            in_opening[start] = opening_idx
+            nr_exposed += 1
+            opening = [start]  # Cells belonging to the opening
+            check = deque([orig_coord])  # Coords whose neighbours need checking
             while check:
-                coord = check.pop()
-                nbrs = set(self.get_nbrs(coord))
-                check |= {
-                    c for c in nbrs - opening if self.completed_board[c] == CellNum(0)
-                }
-                opening |= nbrs
-            openings.append(sorted(opening))
-            blanks_to_check -= opening
-        return openings
-
-    def _calc_3bv(self) -> int:
-        """Calculate the 3bv of the board."""
+                for nbr in nbrs_table[check.popleft()]:
+                    i = nbr[0] * y_size + nbr[1]
+                    if in_opening[i] == opening_idx:
+                        continue
+                    elif in_opening[i] < 0:
+                        nr_exposed += 1
+                    in_opening[i] = opening_idx
+                    opening.append(i)
+                    if is_blank[i]:
+                        check.append(nbr)
+            openings.append([all_coords[i] for i in sorted(opening)])
+        return openings, nr_exposed
+
+    def _calc_3bv(self, nr_exposed: int) -> int:
+        """
+        Calculate the 3bv of the board.
+
+        :param nr_exposed:
+            The number of cells exposed by the board's openings.
+        """
         clicks = len(self.openings)
-        exposed = len({c for opening in self.openings for c in opening})
-        clicks += self.x_size * self.y_size - len(set(self.mine_coords)) - exposed
+        clicks += self.x_size * self.y_size - len(set(self.mine_coords)) - nr_exposed
         return clicks
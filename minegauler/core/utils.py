@@ -7,6 +7,7 @@ Exports:
 TODO
 """
 
+import copy
 import inspect
 import logging
 from inspect import Parameter
@@ -86,14 +87,21 @@ class StructConstructorMixin:
         Create an instance of the structure by extracting element values from
         a dictionary. Ignores extra attributes.
         """
-        args = {a: v for a, v in dict_.items() if a in attr.fields_dict(cls)}
+        fields = attr.fields_dict(cls)
+        args = {a: dict_[a] for a in dict_.keys() & fields.keys()}
         return cls(**args)
 
     def copy(self):
         """
-        Create and return a copy of the struct instance.
+        Create and return a copy of the struct instance. Mutable containers
+        held by the struct are copied rather than shared.
         """
-        return self._from_struct(self)
+        changes = {}
+        for field in attr.fields(type(self)):
+            value = getattr(self, field.name)
+            if isinstance(value, (dict, list, set)):
+                changes[field.name] = copy.copy(value)
+        return attr.evolve(self, **changes)
 
 
 @attr.attrs(auto_attribs=True)
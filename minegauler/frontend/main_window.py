@@ -13,9 +13,11 @@ MinegaulerGUI
 
 __all__ = ("MinegaulerGUI",)
 
+import contextlib
+import functools
 import logging
 import os
-from typing import Optional
+from typing import Iterator, Optional
 
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QIcon
@@ -23,7 +25,6 @@ from PyQt5.QtWidgets import (
     QAction,
     QActionGroup,
     QFrame,
-    QHBoxLayout,
     QMainWindow,
     QMenuBar,
     QSizePolicy,
@@ -32,7 +33,7 @@ from PyQt5.QtWidgets import (
 )
 
 from .. import core
-from ..utils import GameState, get_difficulty
+from ..utils import DIFFICULTY_SETTINGS, GameState, get_difficulty
 from . import api, utils
 from .minefield import MinefieldWidget
 from .panel import PanelWidget
@@ -40,6 +41,18 @@ from .panel import PanelWidget
 
 logger = logging.getLogger(__name__)
 
+_ICON_PATH = os.path.join(utils.IMG_DIR, "icon.ico")
+_DIFFICULTIES = ("Beginner", "Intermediate", "Expert", "Master")  # , "Custom"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_app_icon() -> QIcon:
+    """
+    Get the application icon, loading it from file on the first call. Must not
+    be called before the QApplication has been created.
+    """
+    return QIcon(_ICON_PATH)
+
 
 class BaseMainWindow(QMainWindow):
     """
@@ -68,24 +81,28 @@ class BaseMainWindow(QMainWindow):
         self._help_menu = self._menubar.addMenu("Help")
         self._panel_frame: QFrame
         self._body_frame: QFrame
-        self._footer_frame: QFrame
+        self._footer_frame: Optional[QFrame] = None
         self._panel_widget: Optional[QWidget] = panel_widget
         self._body_widget: Optional[QWidget] = body_widget
         self._footer_widget: Optional[QWidget] = footer_widget
-        self._icon: QIcon = QIcon(os.path.join(utils.IMG_DIR, "icon.ico"))
-        self.setWindowTitle(title)
-        self.setWindowIcon(self._icon)
-        # Disable maximise button
-        self.setWindowFlags(self.windowFlags() | Qt.CustomizeWindowHint)
-        self.setWindowFlags(self.windowFlags() & ~Qt.WindowMaximizeButtonHint)
-        self._populate_menubars()
-        self._setup_ui()
-        if self._panel_widget is not None:
-            self.set_panel_widget(self._panel_widget)
-        if self._body_widget is not None:
-            self.set_body_widget(self._body_widget)
-        if self._footer_widget is not None:
-            self.set_footer_widget(self._footer_widget)
+        self._icon: QIcon = _get_app_icon()
+        self._deferred_menus_populated: bool = False
+        with self._updates_disabled():
+            self.setWindowTitle(title)
+            self.setWindowIcon(self._icon)
+            # Disable maximise button
+            self.setWindowFlags(
+                (self.windowFlags() | Qt.CustomizeWindowHint)
+                & ~Qt.WindowMaximizeButtonHint
+            )
+            self._populate_menubars()
+            self._setup_ui()
+            if self._panel_widget is not None:
+                self.set_panel_widget(self._panel_widget)
+            if self._body_widget is not None:
+                self.set_body_widget(self._body_widget)
+            if self._footer_widget is not None:
+                self.set_footer_widget(self._footer_widget)
         # Keep track of all subwindows that are open.
         self._open_subwindows = {}
 
@@ -109,21 +126,14 @@ class BaseMainWindow(QMainWindow):
         self._panel_frame.setLineWidth(2)
         self._panel_frame.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         vlayout.addWidget(self._panel_frame)
-        # Main body widget config - use horizontal layout for centre alignment.
-        hstretch = QHBoxLayout()
-        hstretch.addStretch()  # left-padding for centering
+        # Main body widget config - centred horizontally.
         self._body_frame = QFrame(central_widget)
         self._body_frame.setFrameShadow(QFrame.Raised)
         self._body_frame.setFrameShape(QFrame.Box)
         self._body_frame.setLineWidth(self.BODY_FRAME_WIDTH)
         self._body_frame.setSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        hstretch.addWidget(self._body_frame)
-        hstretch.addStretch()  # right-padding for centering
-        vlayout.addLayout(hstretch)
-
-        # Name entry bar underneath the minefield
-        self._footer_frame = QFrame(central_widget)
-        vlayout.addWidget(self._footer_frame)
+        vlayout.addWidget(self._body_frame, alignment=Qt.AlignHCenter)
+        # The footer frame is only created if a footer widget is set.
 
     def set_panel_widget(self, widget: QWidget) -> None:
         """
@@ -133,9 +143,7 @@ class BaseMainWindow(QMainWindow):
         widget (QWidget)
             The widget instance to place in the top panel.
         """
-        lyt = QVBoxLayout(self._panel_frame)
-        lyt.setContentsMargins(0, 0, 0, 0)
-        lyt.addWidget(widget)
+        self._install_into_frame(self._panel_frame, widget)
         self._panel_widget = widget
 
     def set_body_widget(self, widget: QWidget) -> None:
@@ -146,9 +154,7 @@ class BaseMainWindow(QMainWindow):
         widget (QWidget)
             The widget instance to place in the body.
         """
-        lyt = QVBoxLayout(self._body_frame)
-        lyt.setContentsMargins(0, 0, 0, 0)
-        lyt.addWidget(widget)
+        self._install_into_frame(self._body_frame, widget)
         self._body_widget = widget
 
     def set_footer_widget(self, widget: QWidget) -> None:
@@ -159,19 +165,58 @@ class BaseMainWindow(QMainWindow):
         widget (QWidget)
             The widget instance to place in the lower bar.
         """
-        lyt = QVBoxLayout(self._footer_frame)
+        if self._footer_frame is None:
+            # Name entry bar underneath the minefield
+            central_widget = self.centralWidget()
+            self._footer_frame = QFrame(central_widget)
+            central_widget.layout().addWidget(self._footer_frame)
+        self._install_into_frame(self._footer_frame, widget)
+        self._footer_widget = widget
+
+    @staticmethod
+    def _install_into_frame(frame: QFrame, widget: QWidget) -> None:
+        """Place a widget in one of the window's frames, filling the frame."""
+        lyt = QVBoxLayout(frame)
         lyt.setContentsMargins(0, 0, 0, 0)
         lyt.addWidget(widget)
-        self._footer_widget = widget
 
     def _populate_menubars(self):
         # GAME MENU
-        exit_act = self._game_menu.addAction("Exit", self.close)
-        exit_act.setShortcut("Alt+F4")
+        self._game_menu.addAction("Exit", self.close, shortcut="Alt+F4")
+
+    def _populate_deferred_menubars(self) -> None:
+        """
+        Fill in menu items that aren't needed until the window is shown. Called
+        on the first show event.
+        """
+
+    # --------------------------------------------------------------------------
+    # Qt method overrides
+    # --------------------------------------------------------------------------
+    def showEvent(self, event):
+        """Handle show event."""
+        if not self._deferred_menus_populated:
+            self._deferred_menus_populated = True
+            self._populate_deferred_menubars()
+        super().showEvent(event)
 
     # --------------------------------------------------------------------------
     # Other methods
     # --------------------------------------------------------------------------
+    @contextlib.contextmanager
+    def _updates_disabled(self) -> Iterator[None]:
+        """
+        Context manager to disable painting of the window while making a
+        batch of changes, so that it is only laid out and repainted once at
+        the end. Can be nested.
+        """
+        was_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.setUpdatesEnabled(was_enabled)
+
     def update_size(self):
         """Update the window size."""
         self._body_frame.adjustSize()
@@ -208,19 +253,30 @@ class MinegaulerGUI(BaseMainWindow):
         # TODO: Something's not right, this should come first...
         super().__init__("MineGauler")
 
-        self._panel_widget = PanelWidget(self, ctrlr, self.game_opts.mines)
-        self._minefield_widget = MinefieldWidget(
-            self,
-            ctrlr,
-            btn_size=self.gui_opts.btn_size,
-            styles=self.gui_opts.styles,
-            drag_select=self.gui_opts.drag_select,
+        with self._updates_disabled():
+            self._panel_widget = PanelWidget(self, ctrlr, self.game_opts.mines)
+            self._minefield_widget = MinefieldWidget(
+                self,
+                ctrlr,
+                btn_size=self.gui_opts.btn_size,
+                styles=self.gui_opts.styles,
+                drag_select=self.gui_opts.drag_select,
+            )
+            self.set_panel_widget(self._panel_widget)
+            self.set_body_widget(self._minefield_widget)
+
+        # Limit how often the face is redrawn when dragging the mouse across
+        #  the minefield. Both widgets live in the GUI thread, so the signals
+        #  are connected directly.
+        self._risk_throttler = utils.CallThrottler(30, self)
+        self._minefield_widget.at_risk_signal.connect(
+            self._risk_throttler.throttle(self._panel_widget.at_risk),
+            Qt.DirectConnection,
+        )
+        self._minefield_widget.no_risk_signal.connect(
+            self._risk_throttler.throttle(self._panel_widget.no_risk),
+            Qt.DirectConnection,
         )
-        self.set_panel_widget(self._panel_widget)
-        self.set_body_widget(self._minefield_widget)
-
-        self._minefield_widget.at_risk_signal.connect(self._panel_widget.at_risk)
-        self._minefield_widget.no_risk_signal.connect(self._panel_widget.no_risk)
 
     def _populate_menubars(self) -> None:
         """Fill in the menubars."""
@@ -228,12 +284,10 @@ class MinegaulerGUI(BaseMainWindow):
         # Game menu
         # ----------
         # New game (F2)
-        new_game_act = self._game_menu.addAction("New game", self.ctrlr.new_game)
-        new_game_act.setShortcut("F2")
+        self._game_menu.addAction("New game", self.ctrlr.new_game, shortcut="F2")
 
         # Replay game (F3)
-        replay_act = self._game_menu.addAction("Replay", self.ctrlr.restart_game)
-        replay_act.setShortcut("F3")
+        self._game_menu.addAction("Replay", self.ctrlr.restart_game, shortcut="F3")
 
         # Create board
 
@@ -263,18 +317,17 @@ class MinegaulerGUI(BaseMainWindow):
         # - Master (m)
         # - Custom (c)
         diff_group = QActionGroup(self, exclusive=True)
-        for diff in ["Beginner", "Intermediate", "Expert", "Master"]:  # , 'Custom']:
+        current_diff = get_difficulty(
+            self.game_opts.x_size, self.game_opts.y_size, self.game_opts.mines
+        )
+        for diff in _DIFFICULTIES:
             diff_act = QAction(diff, diff_group, checkable=True)
             self._game_menu.addAction(diff_act)
             diff_act.id = diff[0]
-            if diff_act.id == get_difficulty(
-                self.game_opts.x_size, self.game_opts.y_size, self.game_opts.mines
-            ):
+            if diff_act.id == current_diff:
                 diff_act.setChecked(True)
-            diff_act.triggered.connect(
-                lambda _: self._change_difficulty(diff_group.checkedAction().id)
-            )
             diff_act.setShortcut(diff[0])
+        diff_group.triggered.connect(self._on_difficulty_triggered)
 
         self._game_menu.addSeparator()
 
@@ -290,6 +343,8 @@ class MinegaulerGUI(BaseMainWindow):
         # Exit (F4)
         self._game_menu.addAction("Exit", self.close, shortcut="Alt+F4")
 
+    def _populate_deferred_menubars(self) -> None:
+        """Fill in the menus that can wait until the window is shown."""
         # ----------
         # Options menu
         # ----------
@@ -314,43 +369,40 @@ class MinegaulerGUI(BaseMainWindow):
         drag_act.setChecked(self.gui_opts.drag_select)
 
         # Max mines per cell option
-        def get_change_per_cell_func(n):
-            def change_per_cell():
-                self.game_opts.per_cell = n
-                self.ctrlr.set_per_cell(n)
-
-            return change_per_cell
-
         per_cell_menu = self._opts_menu.addMenu("Max per cell")
         per_cell_group = QActionGroup(self, exclusive=True)
         for i in range(1, 4):
 
             action = QAction(str(i), self, checkable=True)
+            action.setData(i)
             per_cell_menu.addAction(action)
             per_cell_group.addAction(action)
             if self.game_opts.per_cell == i:
                 action.setChecked(True)
-            action.triggered.connect(get_change_per_cell_func(i))
+        per_cell_group.triggered.connect(self._on_per_cell_triggered)
 
         # ----------
         # Help menu
         # ----------
         # TODO: None yet...
 
-    def _change_difficulty(self, id_: str) -> None:
-        if id_ == "B":
-            x, y, m = 8, 8, 10
-        elif id_ == "I":
-            x, y, m = 16, 16, 40
-        elif id_ == "E":
-            x, y, m = 30, 16, 99
-        elif id_ == "M":
-            x, y, m = 30, 30, 200
-        else:
-            raise ValueError(f"Unrecognised difficulty '{id_}'")
+    def _on_difficulty_triggered(self, action: QAction) -> None:
+        self._change_difficulty(action.id)
 
-        self.ctrlr.resize_board(x_size=x, y_size=y, mines=m)
-        self.update_size()
+    def _on_per_cell_triggered(self, action: QAction) -> None:
+        self.game_opts.per_cell = action.data()
+        self.ctrlr.set_per_cell(action.data())
+
+    def _change_difficulty(self, id_: str) -> None:
+        try:
+            x, y, m = DIFFICULTY_SETTINGS[id_]
+        except KeyError:
+            raise ValueError(f"Unrecognised difficulty '{id_}'") from None
+
+        # Only repaint once the board has been resized and the window fitted.
+        with self._updates_disabled():
+            self.ctrlr.resize_board(x_size=x, y_size=y, mines=m)
+            self.update_size()
 
     def get_panel_widget(self) -> PanelWidget:
         return self._panel_widget
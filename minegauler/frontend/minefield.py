@@ -11,13 +11,14 @@ MinefieldWidget
 
 __all__ = ("MinefieldWidget",)
 
+import functools
 import logging
 import os
 import sys
-from typing import Dict, Optional
+from typing import Dict, Optional, Set
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QImage, QPainter, QPixmap
+from PyQt5.QtCore import QRectF, Qt, pyqtSignal
+from PyQt5.QtGui import QPainter, QPixmap
 from PyQt5.QtWidgets import QApplication, QGraphicsScene, QGraphicsView, QWidget
 
 from minegauler.types import *
@@ -29,6 +30,10 @@ from .utils import IMG_DIR
 
 logger = logging.getLogger(__name__)
 
+# Cell contents instances are shared, so compare against this by identity.
+_UNCLICKED = CellUnclicked()
+_LEFT_AND_RIGHT = Qt.LeftButton | Qt.RightButton
+
 
 # @@@LG :'(         ... please don't look at the contents of these two functions.
 def init_or_update_cell_images(cell_images, size, styles, required=CellImageType.ALL):
@@ -50,7 +55,7 @@ def init_or_update_cell_images(cell_images, size, styles, required=CellImageType
         cell_images["btn_down"] = make_pixmap(
             "buttons", btn_style, "btn_down.png", size
         )
-        cell_images[CellUnclicked()] = cell_images["btn_up"]
+        cell_images[_UNCLICKED] = cell_images["btn_up"]
         cell_images[CellNum(0)] = cell_images["btn_down"]
 
     if required & (CellImageType.BUTTONS | CellImageType.NUMBERS):
@@ -75,37 +80,57 @@ def init_or_update_cell_images(cell_images, size, styles, required=CellImageType
             )
 
 
+@functools.lru_cache(maxsize=None)
 def make_pixmap(img_subdir, style, bg_fname, size, fg_fname=None, propn=1):
-    def get_path(subdir, fname, style):
-        base_path = os.path.join(IMG_DIR, subdir)
-        full_path = os.path.join(base_path, style, fname)
-        if not os.path.exists(full_path):
-            logger.warning(f"Missing image file at {full_path}, using standard style")
-            full_path = os.path.join(base_path, "standard", fname)
-        return full_path
-
-    bg_path = get_path("buttons", bg_fname, style)
+    """
+    Make a cell image, overlaying the foreground image on the background. The
+    result is cached, so must not be modified.
+    """
+    bg_path = _get_image_path("buttons", bg_fname, style)
+    # Copy the cached background, leaving it untouched when drawn on.
+    image = QPixmap(_load_scaled_pixmap(bg_path, size))
     if fg_fname:
-        image = QImage(bg_path).scaled(
-            size, size, transformMode=Qt.SmoothTransformation
-        )
-        fg_size = propn * size
-        fg_path = get_path(img_subdir, fg_fname, "Standard")
-        overlay = QPixmap(fg_path).scaled(
-            fg_size, fg_size, transformMode=Qt.SmoothTransformation
-        )
+        fg_size = int(propn * size)
+        fg_path = _get_image_path(img_subdir, fg_fname, "Standard")
+        overlay = _load_scaled_pixmap(fg_path, fg_size)
         painter = QPainter(image)
-        margin = size * (1 - propn) / 2
+        margin = int(size * (1 - propn) / 2)
         painter.drawPixmap(margin, margin, overlay)
         painter.end()
-        image = QPixmap.fromImage(image)
-    else:
-        image = QPixmap(bg_path).scaled(
-            size, size, transformMode=Qt.SmoothTransformation
-        )
     return image
 
 
+@functools.lru_cache(maxsize=None)
+def _get_image_path(subdir: str, fname: str, style: str) -> str:
+    """
+    Get the path to an image file, falling back to the standard style if the
+    file is missing. The result is cached to avoid repeatedly checking the
+    filesystem.
+    """
+    base_path = os.path.join(IMG_DIR, subdir)
+    full_path = os.path.join(base_path, style, fname)
+    if not os.path.exists(full_path):
+        logger.warning(f"Missing image file at {full_path}, using standard style")
+        full_path = os.path.join(base_path, "standard", fname)
+    return full_path
+
+
+@functools.lru_cache(maxsize=None)
+def _load_scaled_pixmap(path: str, size: int) -> QPixmap:
+    """
+    Load an image from file and scale it to a square of the given size. The
+    result is cached, so must not be modified.
+    """
+    pixmap = QPixmap(path)
+    width, height = pixmap.width(), pixmap.height()
+    if width and height and size % width == 0 and size % height == 0:
+        # Scaling up by a whole number doesn't need smoothing.
+        mode = Qt.FastTransformation
+    else:
+        mode = Qt.SmoothTransformation
+    return pixmap.scaled(size, size, transformMode=mode)
+
+
 class MinefieldWidget(QGraphicsView):
     """
     The minefield widget.
@@ -141,8 +166,28 @@ class MinefieldWidget(QGraphicsView):
         self.cell_images: Dict = {}
         init_or_update_cell_images(self.cell_images, btn_size, self.img_styles)
         self.scene = QGraphicsScene()
+        # The board is drawn as the scene background rather than with items,
+        #  so there's nothing for the scene to index.
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
+        # The view is always sized to fit the board exactly and is only ever
+        #  drawn from pixmaps, so turn off scrolling and antialiasing support.
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setTransformationAnchor(QGraphicsView.NoAnchor)
+        self.setRenderHints(QPainter.RenderHints())
+        self.setOptimizationFlags(
+            QGraphicsView.DontSavePainterState | QGraphicsView.DontAdjustForAntialiasing
+        )
         self.setFixedSize(self.x_size * self.btn_size, self.y_size * self.btn_size)
+        # The cell images are drawn onto a single pixmap covering the board,
+        #  which is painted as the scene background.
+        self._board_pixmap: QPixmap
+        # The images shown by cells that aren't showing the unclicked image.
+        self._changed_cell_images: Dict[Coord_T, QPixmap] = {}
+        # Cells changed while the widget was hidden, drawn when next shown.
+        self._undrawn_cells: Set[Coord_T] = set()
+        self._create_board_pixmap()
         # Keep track of mouse button states.
         self.mouse_coord = None
         self.both_mouse_buttons_pressed = False
@@ -163,13 +208,29 @@ class MinefieldWidget(QGraphicsView):
     # --------------------------------------------------------------------------
     # Qt method overrides
     # --------------------------------------------------------------------------
+    def drawBackground(self, painter: QPainter, rect: QRectF) -> None:
+        """Draw the board, only repainting the required area."""
+        painter.drawPixmap(rect, self._board_pixmap, rect)
+
+    def showEvent(self, event):
+        """Handle show events."""
+        unclicked_image = self.cell_images[_UNCLICKED]
+        for coord in self._undrawn_cells:
+            self._draw_cell(
+                coord, self._changed_cell_images.get(coord, unclicked_image)
+            )
+        self._undrawn_cells.clear()
+        super().showEvent(event)
+
     def mousePressEvent(self, event):
         """Handle mouse press events."""
 
+        button = event.button()
+        buttons = event.buttons()
         # Ignore any clicks which aren't the left or right mouse buttons.
-        if event.button() not in [Qt.LeftButton, Qt.RightButton]:
+        if button != Qt.LeftButton and button != Qt.RightButton:
             return
-        if event.button() == event.buttons():
+        if button == buttons:
             self.await_release_all_buttons = False
             self.both_mouse_buttons_pressed = False
         elif self.await_release_all_buttons:
@@ -180,31 +241,30 @@ class MinefieldWidget(QGraphicsView):
         self.mouse_coord = coord = self.coord_from_event(event)
 
         ## Bothclick
-        if event.buttons() & Qt.LeftButton and event.buttons() & Qt.RightButton:
+        if buttons & _LEFT_AND_RIGHT == _LEFT_AND_RIGHT:
             logger.debug("Both mouse buttons down on cell %s", coord)
             self.both_mouse_buttons_pressed = True
             self.both_buttons_down(coord)
         ## Leftclick
-        elif event.button() == Qt.LeftButton:
+        elif button == Qt.LeftButton:
             logger.debug("Left mouse button down on cell %s", coord)
             self.was_double_left_click = False
             self.left_button_down(coord)
         ## Rightclick
-        elif event.button() == Qt.RightButton:
+        elif button == Qt.RightButton:
             logger.debug("Right mouse button down on cell %s", coord)
             self.right_button_down(coord)
 
     def mouseDoubleClickEvent(self, event):
         """Handle double clicks."""
 
-        coord = self.coord_from_event(event)
-
+        button = event.button()
         # Redirect double right-clicks to be two normal clicks.
-        if event.button() == Qt.RightButton:
+        if button == Qt.RightButton:
             return self.mousePressEvent(event)
-        elif event.button() == Qt.LeftButton and not self.both_mouse_buttons_pressed:
+        elif button == Qt.LeftButton and not self.both_mouse_buttons_pressed:
             self.was_double_left_click = True
-            self.left_button_double_down(coord)
+            self.left_button_double_down(self.coord_from_event(event))
 
     def mouseMoveEvent(self, event):
         """Handle mouse move events."""
@@ -213,11 +273,12 @@ class MinefieldWidget(QGraphicsView):
             return
 
         coord = self.coord_from_event(event)
+        buttons = event.buttons()
 
         # Return if not the left or right mouse buttons, or if the mouse wasn't
         #  moved to a different cell.
         if (
-            not event.buttons() & (Qt.LeftButton | Qt.RightButton)
+            not buttons & _LEFT_AND_RIGHT
             or self.await_release_all_buttons
             or coord == self.mouse_coord
         ):
@@ -227,50 +288,55 @@ class MinefieldWidget(QGraphicsView):
 
         ## Double leftclick
         if self.was_double_left_click:
-            if event.buttons() == Qt.LeftButton:
+            if buttons == Qt.LeftButton:
                 self.left_button_double_move(coord)
             return
 
         ## Bothclick
-        if event.buttons() & Qt.LeftButton and event.buttons() & Qt.RightButton:
+        if buttons & _LEFT_AND_RIGHT == _LEFT_AND_RIGHT:
             self.both_buttons_move(coord)
         elif not self.both_mouse_buttons_pressed or self.drag_select:
             ## Leftclick
-            if event.buttons() & Qt.LeftButton:
+            if buttons & Qt.LeftButton:
                 self.left_button_move(coord)
             ## Rightclick
-            if event.buttons() & Qt.RightButton:
+            if buttons & Qt.RightButton:
                 self.right_button_move(coord)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release events."""
 
-        if self.await_release_all_buttons and not event.buttons():
+        button = event.button()
+        buttons = event.buttons()
+        if self.await_release_all_buttons and not buttons:
             self.await_release_all_buttons = False
             return
         # Ignore any clicks which aren't the left or right mouse buttons.
-        if event.button() not in [Qt.LeftButton, Qt.RightButton] or self._ignore_clicks:
+        if (
+            button != Qt.LeftButton and button != Qt.RightButton
+        ) or self._ignore_clicks:
             return
 
         coord = self.coord_from_event(event)
+        other_button_down = bool(buttons & _LEFT_AND_RIGHT)
 
         ## Bothclick (one of the buttons still down)
-        if event.buttons() & (Qt.LeftButton | Qt.RightButton):
+        if other_button_down:
             logger.debug("Mouse button release on cell %s after both down", coord)
             self.first_of_both_buttons_release(coord)
 
-            if self.drag_select and event.button() == Qt.LeftButton:
+            if self.drag_select and button == Qt.LeftButton:
                 # Only right button down - no risk.
                 self.no_risk_signal.emit()
 
         elif not self.both_mouse_buttons_pressed:
             ## Leftclick
-            if event.button() == Qt.LeftButton and not self.was_double_left_click:
+            if button == Qt.LeftButton and not self.was_double_left_click:
                 logger.debug("Left mouse button release on cell %s", coord)
                 self.left_button_release(coord)
 
         # Reset variables if neither of the mouse buttons are down.
-        if not (event.buttons() & (Qt.LeftButton | Qt.RightButton)):
+        if not other_button_down:
             logger.debug("No mouse buttons down, reset variables")
             self.all_buttons_release()
 
@@ -328,7 +394,7 @@ class MinefieldWidget(QGraphicsView):
         functions as appropriate.
         """
         self.ctrlr.flag_cell(coord)
-        if self._board[coord] == CellUnclicked():
+        if self._board[coord] is _UNCLICKED:
             self.unflag_on_right_drag = True
         else:
             self.unflag_on_right_drag = False
@@ -396,12 +462,14 @@ class MinefieldWidget(QGraphicsView):
         x, y = coord
         return 0 <= x < self.x_size and 0 <= y < self.y_size
 
-    def coord_from_event(self, event) -> Coord_T:
-        coord = event.x() // self.btn_size, event.y() // self.btn_size
-        if not self.is_coord_in_grid(coord):
-            coord = None
-
-        return coord
+    def coord_from_event(self, event) -> Optional[Coord_T]:
+        # Called for every mouse move, so the bounds check is done inline.
+        size = self.btn_size
+        x, y = event.x() // size, event.y() // size
+        if 0 <= x < self.x_size and 0 <= y < self.y_size:
+            return x, y
+        else:
+            return None
 
     def reset(self) -> None:
         """Reset all cell images and other state for a new game."""
@@ -410,8 +478,8 @@ class MinefieldWidget(QGraphicsView):
         self.both_mouse_buttons_pressed = False
         self.await_release_all_buttons = True
         self.update_game_state(GameState.READY)
-        for c in self._board.all_coords:
-            self.set_cell_image(c, CellUnclicked())
+        for c in list(self._changed_cell_images):
+            self.set_cell_image(c, _UNCLICKED)
 
     def sink_unclicked_cell(self, coord: Coord_T) -> None:
         """
@@ -419,7 +487,7 @@ class MinefieldWidget(QGraphicsView):
         """
         if self._game_state.finished():
             return
-        if self._board[coord] == CellUnclicked():
+        if self._board[coord] is _UNCLICKED:
             self.set_cell_image(coord, "btn_down")
             self.sunken_cells.add(coord)
         if self.sunken_cells:
@@ -431,7 +499,7 @@ class MinefieldWidget(QGraphicsView):
         """
         while self.sunken_cells:
             coord = self.sunken_cells.pop()
-            if self._board[coord] == CellUnclicked():
+            if self._board[coord] is _UNCLICKED:
                 self.set_cell_image(coord, "btn_up")
 
     def set_cell_image(self, coord: Coord_T, state) -> None:
@@ -444,9 +512,42 @@ class MinefieldWidget(QGraphicsView):
         state
             The cell_images key for the image to be set.
         """
+        image = self.cell_images[state]
+        unclicked_image = self.cell_images[_UNCLICKED]
+        if image is self._changed_cell_images.get(coord, unclicked_image):
+            return
+        elif image is unclicked_image:
+            del self._changed_cell_images[coord]
+        else:
+            self._changed_cell_images[coord] = image
+        if self.isVisible():
+            self._draw_cell(coord, image)
+        else:
+            self._undrawn_cells.add(coord)
+
+    def _draw_cell(self, coord: Coord_T, image: QPixmap) -> None:
+        """Draw a cell's image on the board pixmap."""
         x, y = coord
-        b = self.scene.addPixmap(self.cell_images[state])
-        b.setPos(x * self.btn_size, y * self.btn_size)
+        size = self.btn_size
+        painter = QPainter(self._board_pixmap)
+        painter.drawPixmap(x * size, y * size, image)
+        painter.end()
+        self.scene.update(x * size, y * size, size, size)
+
+    def _create_board_pixmap(self) -> None:
+        """
+        Create the pixmap for the current board size, with every cell showing
+        the unclicked cell image.
+        """
+        width, height = self.x_size * self.btn_size, self.y_size * self.btn_size
+        self.setSceneRect(0, 0, width, height)
+        self._board_pixmap = QPixmap(width, height)
+        painter = QPainter(self._board_pixmap)
+        painter.drawTiledPixmap(0, 0, width, height, self.cell_images[_UNCLICKED])
+        painter.end()
+        self._changed_cell_images.clear()
+        self._undrawn_cells.clear()
+        self.scene.update()
 
     def ignore_clicks(self) -> None:
         self._ignore_clicks = True
@@ -464,11 +565,7 @@ class MinefieldWidget(QGraphicsView):
         )
         self.x_size, self.y_size = x_size, y_size
         self.setFixedSize(self.x_size * self.btn_size, self.y_size * self.btn_size)
-        self.setSceneRect(
-            0, 0, self.x_size * self.btn_size, self.y_size * self.btn_size
-        )
-        for c in [(i, j) for i in range(self.x_size) for j in range(self.y_size)]:
-            self.set_cell_image(c, CellUnclicked())
+        self._create_board_pixmap()
 
     def update_style(self, img_type, style):
         logger.info("Updating %s style to '%s'", img_type.name, style)
@@ -4,10 +4,12 @@ utils.py - Utilities for the frontend.
 December 2018, Lewis Gaul
 """
 
+import functools
 import os
-from typing import Dict
+from typing import Callable, Dict, Optional
 
 import attr
+from PyQt5.QtCore import QObject, QTimer
 
 from minegauler import ROOT_DIR
 from minegauler.core.utils import StructConstructorMixin
@@ -30,3 +32,54 @@ class GuiOptsStruct(StructConstructorMixin):
         CellImageType.NUMBERS: "Standard",
         CellImageType.MARKERS: "Standard",
     }
+
+
+class CallThrottler:
+    """
+    Limit the rate of calls to a group of functions, e.g. slots which display
+    the latest state from a frequently emitted signal.
+
+    The first call is made immediately, after which calls are held back until
+    the interval has passed. Only the most recent of any held back calls is
+    then made, so calls to different functions sharing a throttler are never
+    reordered.
+    """
+
+    def __init__(self, interval: int, parent: Optional[QObject] = None):
+        """
+        :param interval:
+            The minimum time between calls, in milliseconds.
+        :param parent:
+            Optional parent for the Qt timer.
+        """
+        self._pending: Optional[Callable[[], None]] = None
+        self._timer = QTimer(parent)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def throttle(self, func: Callable[..., None]) -> Callable[..., None]:
+        """
+        Wrap a function so that calls to it are throttled.
+
+        :param func:
+            The function to wrap.
+        :return:
+            The wrapped function.
+        """
+
+        @functools.wraps(func)
+        def throttled(*args, **kwargs) -> None:
+            if self._timer.isActive():
+                self._pending = functools.partial(func, *args, **kwargs)
+            else:
+                func(*args, **kwargs)
+                self._timer.start()
+
+        return throttled
+
+    def _on_timeout(self) -> None:
+        if self._pending is not None:
+            pending, self._pending = self._pending, None
+            pending()
+            self._timer.start()
@@ -17,6 +17,16 @@ from minegauler.types import *
 
 logger = logging.getLogger(__name__)
 
+# The board dimensions and number of mines for each of the difficulties, keyed
+#  by the difficulty ID.
+DIFFICULTY_SETTINGS = {
+    "B": (8, 8, 10),
+    "I": (16, 16, 40),
+    "E": (30, 16, 99),
+    "M": (30, 30, 200),
+}
+_SETTINGS_DIFFICULTY = {v: k for k, v in DIFFICULTY_SETTINGS.items()}
+
 
 @attr.attrs(auto_attribs=True)
 class PersistSettingsStruct(GameOptsStruct, GuiOptsStruct):
@@ -75,12 +85,4 @@ def write_settings_to_file(settings: PersistSettingsStruct) -> None:
 
 
 def get_difficulty(x_size: int, y_size: int, mines: int) -> str:
-    if x_size == 8 and y_size == 8 and mines == 10:
-        return "B"
-    if x_size == 16 and y_size == 16 and mines == 40:
-        return "I"
-    if x_size == 30 and y_size == 16 and mines == 99:
-        return "E"
-    if x_size == 30 and y_size == 30 and mines == 200:
-        return "M"
-    return "C"
+    return _SETTINGS_DIFFICULTY.get((x_size, y_size, mines), "C")
@@ -0,0 +1,171 @@
+"""
+api_test.py - Test the core API module
+
+October 2026, Lewis Gaul
+
+Uses pytest - simply run 'python -m pytest tests/ [-k api_test]' from the root
+directory.
+"""
+
+from unittest.mock import Mock
+
+from minegauler.core import api
+from minegauler.core.api import AbstractListener, Caller
+from minegauler.types import *
+
+
+class _Listener(AbstractListener):
+    """A listener that records calls made on it using a mock."""
+
+    def __init__(self):
+        self.mock = Mock()
+
+    def reset(self):
+        self.mock.reset()
+
+    def resize(self, x_size, y_size, mines):
+        self.mock.resize(x_size, y_size, mines)
+
+    def update_cells(self, cell_updates):
+        self.mock.update_cells(cell_updates)
+
+    def update_game_state(self, game_state):
+        self.mock.update_game_state(game_state)
+
+    def update_mines_remaining(self, mines_remaining):
+        self.mock.update_mines_remaining(mines_remaining)
+
+    def set_finish_time(self, finish_time):
+        self.mock.set_finish_time(finish_time)
+
+    def handle_exception(self, method, exc):
+        self.mock.handle_exception(method, exc)
+
+
+class TestCaller:
+    # --------------------------------------------------------------------------
+    # Test cases
+    # -------------------------------------------------------------------------
+    def test_create(self):
+        listener = _Listener()
+        caller = Caller([listener])
+        caller.reset()
+        listener.mock.reset.assert_called_once()
+
+    def test_register_unregister(self):
+        listener1 = _Listener()
+        listener2 = _Listener()
+        caller = Caller()
+        assert not caller.has_listeners
+
+        caller.register_listener(listener1)
+        caller.register_listener(listener2)
+        assert caller.has_listeners
+        caller.update_cells({(0, 0): CellNum(1)})
+        listener1.mock.update_cells.assert_called_once_with({(0, 0): CellNum(1)})
+        listener2.mock.update_cells.assert_called_once_with({(0, 0): CellNum(1)})
+
+        caller.unregister_listener(listener1)
+        caller.resize(4, 5, 6)
+        listener1.mock.resize.assert_not_called()
+        listener2.mock.resize.assert_called_once_with(4, 5, 6)
+
+        # Registering a listener twice does nothing.
+        caller.register_listener(listener2)
+        caller.update_mines_remaining(1)
+        listener2.mock.update_mines_remaining.assert_called_once_with(1)
+
+        # Unregistering a listener that isn't registered does nothing.
+        caller.unregister_listener(listener1)
+        caller.update_game_state(GameState.ACTIVE)
+        listener2.mock.update_game_state.assert_called_once_with(GameState.ACTIVE)
+
+    def test_register_twice(self):
+        listener = _Listener()
+        caller = Caller([listener, listener])
+        caller.register_listener(listener)
+
+        # The listener is only called once per update.
+        caller.reset()
+        listener.mock.reset.assert_called_once()
+
+        # A single unregister removes the listener.
+        caller.unregister_listener(listener)
+        assert not caller.has_listeners
+        caller.reset()
+        listener.mock.reset.assert_called_once()
+
+    def test_reregister(self):
+        calls = []
+        listener1 = _Listener()
+        listener2 = _Listener()
+        listener1.mock.update_game_state.side_effect = lambda s: calls.append(1)
+        listener2.mock.update_game_state.side_effect = lambda s: calls.append(2)
+        caller = Caller([listener1, listener2])
+
+        # A re-registered listener is called again, now after the others.
+        caller.unregister_listener(listener1)
+        caller.register_listener(listener1)
+        caller.update_game_state(GameState.WON)
+        assert calls == [2, 1]
+        listener1.mock.update_game_state.assert_called_once_with(GameState.WON)
+        listener2.mock.update_game_state.assert_called_once_with(GameState.WON)
+
+    def test_listener_exception(self):
+        listener1 = _Listener()
+        listener2 = _Listener()
+        exc = Exception("Listener error")
+        listener1.mock.update_mines_remaining.side_effect = exc
+        caller = Caller([listener1, listener2])
+
+        caller.update_mines_remaining(3)
+        listener1.mock.handle_exception.assert_called_once_with(
+            "update_mines_remaining", exc
+        )
+        listener2.mock.update_mines_remaining.assert_called_once_with(3)
+        listener2.mock.handle_exception.assert_not_called()
+
+    def test_listener_exception_unbound_method(self):
+        listener1 = _Listener()
+        listener2 = _Listener()
+        exc = Exception("Listener error")
+
+        # The listener's method needn't be bound to the listener.
+        def update_mines_remaining(mines_remaining):
+            raise exc
+
+        listener1.update_mines_remaining = update_mines_remaining
+        caller = Caller([listener1, listener2])
+
+        caller.update_mines_remaining(3)
+        listener1.mock.handle_exception.assert_called_once_with(
+            "update_mines_remaining", exc
+        )
+        listener2.mock.update_mines_remaining.assert_called_once_with(3)
+
+    def test_register_during_notification(self):
+        listener1 = _Listener()
+        listener2 = _Listener()
+        caller = Caller([listener1])
+
+        # Unregistering and registering from within a callback should not
+        #  affect the notification currently being dispatched.
+        def swap_listeners():
+            caller.unregister_listener(listener1)
+            caller.register_listener(listener2)
+
+        listener1.mock.reset.side_effect = swap_listeners
+        caller.reset()
+        listener1.mock.reset.assert_called_once()
+        listener2.mock.reset.assert_not_called()
+
+        caller.reset()
+        listener1.mock.reset.assert_called_once()
+        listener2.mock.reset.assert_called_once()
+
+    def test_listener_methods(self):
+        # The cached method names must match the abstract methods.
+        assert (
+            set(api._NOTIFY_METHODS) | {"handle_exception"}
+            == AbstractListener.__abstractmethods__
+        )
@@ -183,6 +183,14 @@ class TestController:
         #     mines_remaining=ctrlr._game.mines_remaining,
         # )
 
+        # Remove cell flags when there are none - no update should be sent.
+        listener = Mock()
+        ctrlr.register_listener(listener)
+        ctrlr.remove_cell_flags(coord)
+        assert ctrlr._game.board[coord] == CellUnclicked()
+        listener.update_cells.assert_not_called()
+        ctrlr.unregister_listener(listener)
+
         # Select a cell to start the game.
         ctrlr.select_cell(coord)
         assert isinstance(ctrlr._game.board[coord], (CellHitMine, CellNum))
@@ -816,7 +824,7 @@ class TestController:
         if set_mf:
             ctrlr._game.mf = cls.mf
         if cb:
-            ctrlr._registered_callbacks = [cb]
+            ctrlr.register_listener(cb)
 
         return ctrlr
 
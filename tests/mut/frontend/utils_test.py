@@ -0,0 +1,53 @@
+"""
+utils_test.py - Test the frontend utils module
+
+October 2026, Lewis Gaul
+
+Uses pytest - simply run 'python -m pytest tests/ [-k utils_test]' from the
+root directory.
+"""
+
+from unittest.mock import Mock
+
+from minegauler.frontend.utils import CallThrottler, GuiOptsStruct
+
+
+class TestCallThrottler:
+    interval = 20
+
+    def test_throttle(self, qtbot):
+        func1 = Mock()
+        func2 = Mock()
+        throttler = CallThrottler(self.interval)
+        throttled1 = throttler.throttle(func1)
+        throttled2 = throttler.throttle(func2)
+
+        # The first call is made immediately.
+        throttled1(1)
+        func1.assert_called_once_with(1)
+
+        # Only the last of the calls made within the interval gets made.
+        throttled2()
+        throttled1(2)
+        throttled1(3)
+        assert func1.call_count == 1
+        func2.assert_not_called()
+        qtbot.waitUntil(lambda: func1.call_count == 2)
+        func1.assert_called_with(3)
+        func2.assert_not_called()
+
+        # Calls are made immediately again once the interval has passed with
+        #  nothing pending.
+        qtbot.wait(3 * self.interval)
+        throttled2()
+        func2.assert_called_once_with()
+
+
+class TestGuiOptsStruct:
+    def test_copy(self):
+        opts = GuiOptsStruct(btn_size=20)
+        opts_copy = opts.copy()
+        assert opts_copy == opts
+        assert opts_copy is not opts
+        # Mutable values must not be shared with the copy.
+        assert opts_copy.styles is not opts.styles